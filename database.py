@@ -95,16 +95,10 @@ class NEODatabase:
         :param filters: A collection of filters capturing user-specified criteria.
         :return: A stream of matching `CloseApproach` objects.
         """
-        for approach in self._approaches:
-            if not filters:
-                yield approach
-                continue
-
-            matches_all = True
-            for filter_func in filters:
-                if not filter_func(approach):
-                    matches_all = False
-                    break
-
-            if matches_all:
-                yield approach
+        # Chain the filters with the built-in `filter` so that the iteration over
+        # the approaches is driven from C. Each filter is still a Python call, and
+        # each approach still stops at its first failed filter.
+        matches = iter(self._approaches)
+        for filter_func in filters or ():
+            matches = filter(filter_func, matches)
+        yield from matches
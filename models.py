@@ -17,11 +17,18 @@ quirks of the data set, such as missing names and unknown diameters.
 
 You'll edit this file in Task 1.
 """
-import math
+import sys
 
 from helpers import cd_to_datetime, datetime_to_str
 
 
+# Values that NASA's data files use for a missing numeric field.
+_MISSING = (None, '')
+
+# A shared NaN for unknown numeric values; CPython doesn't cache float objects.
+_NAN = float('nan')
+
+
 class NearEarthObject:
     """A near-Earth object (NEO).
 
@@ -34,6 +41,8 @@ class NearEarthObject:
     initialized to an empty collection, but eventually populated in the
     `NEODatabase` constructor.
     """
+    __slots__ = ('designation', 'name', 'fullname', 'diameter', 'hazardous', 'approaches')
+
     def __init__(self, pdes, name, pha, diameter, **info):
         """Create a new `NearEarthObject`.
 
@@ -43,28 +52,47 @@ class NearEarthObject:
         :param diameter - the NEO's diameter (from an equivalent sphere) in kilometers.
         :param info: A dictionary of excess keyword arguments supplied to the constructor.
         """
-        self.designation = str(pdes) if pdes else None
-        self.name = str(name) if name else None
+        self.designation, self.name, self.hazardous = (
+            sys.intern(str(pdes)) if pdes else None,
+            sys.intern(str(name)) if name else None,
+            pha == 'Y'
+        )
+        self.fullname = f"{self.designation} ({self.name})" if self.name else self.designation
+        # Missing values are common, so check for them rather than raising.
         try:
-            self.diameter = float(diameter)
+            self.diameter = float(diameter) if diameter not in _MISSING else _NAN
         except (ValueError, TypeError):
-            self.diameter = float('nan')
-
-        self.hazardous = bool(pha == 'Y')
+            self.diameter = _NAN
 
         # Create an empty initial collection of linked approaches.
         self.approaches = []
 
-    @property
-    def fullname(self):
-        """Return a representation of the full name of this NEO."""
-        return self.designation + ' ' + self.name
+    def serialize(self):
+        """Return a dictionary of this NEO's attributes for JSON output."""
+        return {
+            'designation': self.designation or '',
+            'name': self.name or '',
+            'diameter_km': self.diameter,
+            'potentially_hazardous': bool(self.hazardous)
+        }
+
+    def serialize_row(self):
+        """Return a tuple of this NEO's attributes for CSV output.
+
+        The fields are in the same order as the NEO columns of the CSV output.
+        """
+        return (
+            self.designation or '',
+            self.name or '',
+            self.diameter,
+            bool(self.hazardous)
+        )
 
     def __str__(self):
         """Return `str(self)`."""
         return (f"NEO {self.designation} ({self.name or 'unnamed'}), "
                 f"{'hazardous' if self.hazardous else 'non-hazardous'}, "
-                f"diameter: {self.diameter if not math.isnan(self.diameter) else 'unknown'} km")
+                f"diameter: {self.diameter if self.diameter == self.diameter else 'unknown'} km")
 
     def __repr__(self):
         """Return `repr(self)`, a computer-readable string representation of this object."""
@@ -85,6 +113,8 @@ class CloseApproach:
     private attribute, but the referenced NEO is eventually replaced in the
     `NEODatabase` constructor.
     """
+    __slots__ = ('_designation', 'time', '_time_str', 'distance', 'velocity', 'neo')
+
     def __init__(self, des, cd, dist, v_rel, **info):
         """Create a new `CloseApproach`.
 
@@ -94,18 +124,20 @@ class CloseApproach:
         :param v_rel - velocity relative to the approach body at close approach (km/s)
         :param info: A dictionary of excess keyword arguments supplied to the constructor.
         """
-        self._designation = str(des) if des else None
+        self._designation = sys.intern(str(des)) if des else None
         self.time = cd_to_datetime(cd)
+        # The formatted time is computed on first use by `time_str`.
+        self._time_str = None
 
         try:
-            self.distance = float(dist)
+            self.distance = float(dist) if dist not in _MISSING else _NAN
         except (ValueError, TypeError):
-            self.distance = float('nan')
+            self.distance = _NAN
 
         try:
-            self.velocity = float(v_rel)
+            self.velocity = float(v_rel) if v_rel not in _MISSING else _NAN
         except (ValueError, TypeError):
-            self.velocity = float('nan')
+            self.velocity = _NAN
 
         # Create an attribute for the referenced NEO, originally None.
         self.neo = None
@@ -121,20 +153,24 @@ class CloseApproach:
 
         The `datetime_to_str` method converts a `datetime` object to a
         formatted string that can be used in human-readable representations and
-        in serialization to CSV and JSON files.
+        in serialization to CSV and JSON files. It is computed on first access
+        and saved for later ones.
         """
-        return datetime_to_str(self.time)
+        if self._time_str is None:
+            self._time_str = datetime_to_str(self.time)
+        return self._time_str
 
     def __str__(self):
         """Return `str(self)`."""
         time_str = self.time_str
 
-        if math.isnan(self.distance):
+        # NaN is the only value that doesn't equal itself.
+        if self.distance != self.distance:
             dist_str = "an unknown distance"
         else:
             dist_str = f"{self.distance:.2f} au"
 
-        if math.isnan(self.velocity):
+        if self.velocity != self.velocity:
             vel_str = "an unknown velocity"
         else:
             vel_str = f"{self.velocity:.2f} km/s"
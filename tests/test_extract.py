@@ -77,6 +77,18 @@ class TestLoadNEOs(unittest.TestCase):
         self.assertEqual(neo.diameter, 0.6)
         self.assertEqual(neo.hazardous, True)
 
+    def test_malformed_diameter_is_nan(self):
+        neo = NearEarthObject(pdes='2019 SC8', name='', pha='N', diameter='unknown')
+        self.assertTrue(math.isnan(neo.diameter))
+
+    def test_named_neo_fullname_has_designation_and_name(self):
+        neo = self.neos_by_designation['2101']
+        self.assertEqual(neo.fullname, '2101 (Adonis)')
+
+    def test_unnamed_neo_fullname_is_designation(self):
+        neo = self.neos_by_designation['2019 SC8']
+        self.assertEqual(neo.fullname, '2019 SC8')
+
 
 class TestLoadApproaches(unittest.TestCase):
     @classmethod
@@ -117,6 +129,11 @@ class TestLoadApproaches(unittest.TestCase):
         self.assertIsNotNone(approach)
         self.assertIsInstance(approach.velocity, float)
 
+    def test_malformed_distance_and_velocity_are_nan(self):
+        approach = CloseApproach(des='2019 SC8', cd='2020-Jan-01 00:00', dist='?', v_rel='?')
+        self.assertTrue(math.isnan(approach.distance))
+        self.assertTrue(math.isnan(approach.velocity))
+
 
 if __name__ == '__main__':
     unittest.main()
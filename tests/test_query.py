@@ -44,6 +44,11 @@ class TestQuery(unittest.TestCase):
         received = set(self.db.query(filters))
         self.assertEqual(expected, received, msg="Computed results do not match expected results.")
 
+    def test_query_with_none_filters(self):
+        expected = set(self.approaches)
+        received = set(self.db.query(None))
+        self.assertEqual(expected, received, msg="Computed results do not match expected results.")
+
     ###############################################
     # Single filters and pairs of related filters #
     ###############################################
@@ -20,6 +20,7 @@ import csv
 import datetime
 import io
 import json
+import math
 import pathlib
 import unittest
 import unittest.mock
@@ -27,6 +28,7 @@ import unittest.mock
 
 from extract import load_neos, load_approaches
 from database import NEODatabase
+from models import NearEarthObject, CloseApproach
 from write import write_to_csv, write_to_json
 
 
@@ -65,6 +67,44 @@ def UncloseableStringIO(value=''):
     buf.close()
 
 
+def write_to_string(write_func, results, **kwargs):
+    """Return what `write_func` writes for `results`, without touching the disk."""
+    with unittest.mock.patch('write.open') as mock_file:
+        with UncloseableStringIO() as buf:
+            mock_file.return_value = buf
+            write_func(results, None, **kwargs)
+            buf.seek(0)
+            return buf.getvalue()
+
+
+def expected_json(results):
+    """Build the JSON-ready list that `write_to_json` should encode for `results`."""
+    return [
+        {
+            'datetime_utc': approach.time_str,
+            'distance_au': approach.distance,
+            'velocity_km_s': approach.velocity,
+            'neo': {
+                'designation': approach.neo.designation if approach.neo else '',
+                'name': (approach.neo.name or '') if approach.neo else '',
+                'diameter_km': approach.neo.diameter if approach.neo else float('nan'),
+                'potentially_hazardous': approach.neo.hazardous if approach.neo else False
+            }
+        }
+        for approach in results
+    ]
+
+
+def build_approach(neo=None, dist='0.25', v_rel='12.5'):
+    """Build a `CloseApproach` by hand, linked to `neo` if one is given."""
+    approach = CloseApproach(des=neo.designation if neo else None,
+                             cd='2020-Jan-01 12:34', dist=dist, v_rel=v_rel)
+    if neo:
+        approach.neo = neo
+        neo.approaches.append(approach)
+    return approach
+
+
 class TestWriteToCSV(unittest.TestCase):
     @classmethod
     @unittest.mock.patch('write.open')
@@ -131,6 +171,20 @@ class TestWriteToCSV(unittest.TestCase):
         self.assertGreater(len(rows), 0)
         self.assertSetEqual(set(fieldnames), set(rows[0].keys()))
 
+    def test_csv_data_quotes_special_characters(self):
+        names = ('Foo, "Bar"', 'Line\nBreak', 'Carriage\rReturn', 'Plain')
+        neos = [NearEarthObject(pdes=f'2020 A{i}', name=name, pha='N', diameter='1.5')
+                for i, name in enumerate(names)]
+        results = [build_approach(neo) for neo in neos]
+
+        value = write_to_string(write_to_csv, results)
+        rows = list(csv.reader(io.StringIO(value, newline='')))
+
+        self.assertEqual(len(rows), len(names) + 1)
+        for row, neo in zip(rows[1:], neos):
+            self.assertEqual(row, ['2020-01-01 12:34', '0.25', '12.5',
+                                   neo.designation, neo.name, '1.5', 'False'])
+
 
 class TestWriteToJSON(unittest.TestCase):
     @classmethod
@@ -226,5 +280,55 @@ class TestWriteToJSON(unittest.TestCase):
         self.assertIsInstance(approach['neo']['potentially_hazardous'], bool)
 
 
+class TestWriteToJSONCompact(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        neo = NearEarthObject(pdes='2020 AB', name='Foo "Bar"\n', pha='Y', diameter='')
+        cls.results = build_results(5) + (
+            build_approach(),
+            build_approach(neo, dist='', v_rel=''),
+            build_approach(neo, dist='inf', v_rel='-inf'),
+        )
+        cls.value = write_to_string(write_to_json, cls.results)
+
+    def test_json_data_matches_reference_encoding(self):
+        expected = json.loads(json.dumps(expected_json(self.results)))
+        self.assertEqual(json.loads(self.value), expected)
+
+    def test_json_data_for_unlinked_approach(self):
+        neo = json.loads(self.value)[5]['neo']
+        self.assertEqual(neo['designation'], '')
+        self.assertEqual(neo['name'], '')
+        self.assertTrue(math.isnan(neo['diameter_km']))
+        self.assertIs(neo['potentially_hazardous'], False)
+
+    def test_json_data_for_nonfinite_distance_and_velocity(self):
+        data = json.loads(self.value)
+        self.assertTrue(math.isnan(data[6]['distance_au']))
+        self.assertTrue(math.isnan(data[6]['velocity_km_s']))
+        self.assertEqual(data[7]['distance_au'], float('inf'))
+        self.assertEqual(data[7]['velocity_km_s'], float('-inf'))
+        self.assertEqual(data[7]['neo']['name'], 'Foo "Bar"\n')
+
+    def test_json_data_with_no_results(self):
+        self.assertEqual(write_to_string(write_to_json, ()), '[]')
+
+
+class TestWriteToJSONPretty(unittest.TestCase):
+    def test_pretty_json_matches_indented_dumps(self):
+        results = build_results(5) + (build_approach(),)
+        value = write_to_string(write_to_json, results, pretty=True)
+        self.assertEqual(value, json.dumps(expected_json(results), indent=2))
+
+    def test_pretty_json_with_one_result(self):
+        results = build_results(1)
+        value = write_to_string(write_to_json, results, pretty=True)
+        self.assertEqual(value, json.dumps(expected_json(results), indent=2))
+
+    def test_pretty_json_with_no_results(self):
+        value = write_to_string(write_to_json, (), pretty=True)
+        self.assertEqual(value, '[]')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -10,10 +10,77 @@ extension determines which of these functions is used.
 
 You'll edit this file in Part 4.
 """
-import csv
+import itertools
 import json
 
 
+# The columns of the CSV output, in order.
+_CSV_FIELDNAMES = (
+    'datetime_utc', 'distance_au', 'velocity_km_s',
+    'designation', 'name', 'diameter_km', 'potentially_hazardous'
+)
+
+# Characters that force a CSV field to be quoted.
+_CSV_SPECIAL = (',', '"', '\r', '\n')
+
+# The number of CSV rows or JSON entries to buffer before writing them at once.
+_CHUNK_SIZE = 4096
+
+# Serialized NEO fields for a close approach that isn't linked to an NEO.
+_EMPTY_NEO_CSV = ('', '', float('nan'), False)
+_EMPTY_NEO_JSON = {
+    'designation': '',
+    'name': '',
+    'diameter_km': float('nan'),
+    'potentially_hazardous': False
+}
+
+# The encodings that `json.dumps` uses for non-finite floats.
+_JSON_NONFINITE = {'nan': 'NaN', 'inf': 'Infinity', '-inf': '-Infinity'}
+
+# Bind the encoder locally to avoid a module attribute lookup per JSON entry.
+_dumps = json.dumps
+
+
+def _csv_field(value):
+    """Format a value as a CSV field, quoting it only if it needs to be quoted.
+
+    This matches the minimal quoting of the `csv` module's default dialect.
+    """
+    text = str(value)
+    if any(c in text for c in _CSV_SPECIAL):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _json_float(value):
+    """Format a float as a JSON number, exactly as `json.dumps` would."""
+    text = repr(value)
+    return _JSON_NONFINITE.get(text, text)
+
+
+class _CSVNeoFields(dict):
+    """A cache from each `NearEarthObject` to its formatted CSV fields.
+
+    Missing NEOs are formatted on first lookup, so the cache can be indexed
+    directly from inside a generator expression.
+    """
+
+    def __missing__(self, neo):
+        fields = ','.join(map(_csv_field, neo.serialize_row() if neo else _EMPTY_NEO_CSV))
+        self[neo] = fields
+        return fields
+
+
+class _JSONNeoFields(dict):
+    """A cache from each `NearEarthObject` to its encoded compact JSON object."""
+
+    def __missing__(self, neo):
+        fields = _dumps(neo.serialize() if neo else _EMPTY_NEO_JSON, separators=(',', ':'))
+        self[neo] = fields
+        return fields
+
+
 def write_to_csv(results, filename):
     """Write an iterable of `CloseApproach` objects to a CSV file.
 
@@ -24,33 +91,24 @@ def write_to_csv(results, filename):
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should be saved.
     """
-    fieldnames = (
-        'datetime_utc', 'distance_au', 'velocity_km_s',
-        'designation', 'name', 'diameter_km', 'potentially_hazardous'
-    )
-    fieldnames = (
-        'datetime_utc', 'distance_au', 'velocity_km_s',
-        'designation', 'name', 'diameter_km', 'potentially_hazardous'
+    # Only the NEO fields can need quoting, so format them once per NEO. The
+    # approach fields are a datetime string and two floats, which never do.
+    neo_fields = _CSVNeoFields()
+    rows = (
+        f'{a.time_str},{a.distance!r},{a.velocity!r},{neo_fields[a.neo]}\r\n'
+        for a in results
     )
 
-    with open(filename, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+    with open(filename, 'w', newline='', buffering=1 << 20) as f:
+        f.write(','.join(_CSV_FIELDNAMES) + '\r\n')
 
-        for approach in results:
-            neo = approach.neo
-            writer.writerow({
-                'datetime_utc': approach.time_str,
-                'distance_au': approach.distance,
-                'velocity_km_s': approach.velocity,
-                'designation': neo.designation if neo else '',
-                'name': neo.name if neo and neo.name else '',
-                'diameter_km': neo.diameter if neo else float('nan'),
-                'potentially_hazardous': neo.hazardous if neo else False
-            })
+        chunk = ''.join(itertools.islice(rows, _CHUNK_SIZE))
+        while chunk:
+            f.write(chunk)
+            chunk = ''.join(itertools.islice(rows, _CHUNK_SIZE))
 
 
-def write_to_json(results, filename):
+def write_to_json(results, filename, pretty=False):
     """Write an iterable of `CloseApproach` objects to a JSON file.
 
     The precise output specification is in `README.md`. Roughly, the output is a
@@ -58,25 +116,50 @@ def write_to_json(results, filename):
     their values and the 'neo' key mapping to a dictionary of the associated
     NEO's attributes.
 
+    By default, the output is compact JSON. If `pretty` is true, the output is
+    indented by two spaces per level instead, which is easier to read but much
+    larger and slower to write.
+
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should be saved.
+    :param pretty: Whether to indent the JSON output for human readers.
     """
-    output = []
-
-    for approach in results:
-        neo = approach.neo
-        entry = {
-            'datetime_utc': approach.time_str,
-            'distance_au': approach.distance,
-            'velocity_km_s': approach.velocity,
-            'neo': {
-                'designation': neo.designation if neo else '',
-                'name': neo.name if neo and neo.name else '',
-                'diameter_km': neo.diameter if neo else float('nan'),
-                'potentially_hazardous': neo.hazardous if neo else False
-            }
-        }
-        output.append(entry)
-
-    with open(filename, 'w') as f:
-        json.dump(output, f, indent=2)
+    if pretty:
+        with open(filename, 'w', buffering=1 << 20) as f:
+            f.write('[')
+            i = -1
+            for i, approach in enumerate(results):
+                neo = approach.neo
+                entry = {
+                    'datetime_utc': approach.time_str,
+                    'distance_au': approach.distance,
+                    'velocity_km_s': approach.velocity,
+                    'neo': neo.serialize() if neo else _EMPTY_NEO_JSON
+                }
+                # Nest each indented entry one level into the enclosing list.
+                f.write(',\n  ' if i else '\n  ')
+                f.write(_dumps(entry, indent=2).replace('\n', '\n  '))
+            f.write('\n]' if i >= 0 else ']')
+        return
+
+    # Encode each NEO once, and splice it into a template for each approach
+    # instead of building and encoding a dictionary. The time string contains
+    # only digits, dashes, colons and a space, so it never needs escaping.
+    neo_json = _JSONNeoFields()
+    entries = (
+        f'{{"datetime_utc":"{a.time_str}",'
+        f'"distance_au":{_json_float(a.distance)},'
+        f'"velocity_km_s":{_json_float(a.velocity)},'
+        f'"neo":{neo_json[a.neo]}}}'
+        for a in results
+    )
+
+    with open(filename, 'w', buffering=1 << 20) as f:
+        f.write('[')
+        chunk = ',\n'.join(itertools.islice(entries, _CHUNK_SIZE))
+        while chunk:
+            f.write(chunk)
+            chunk = ',\n'.join(itertools.islice(entries, _CHUNK_SIZE))
+            if chunk:
+                f.write(',\n')
+        f.write(']')